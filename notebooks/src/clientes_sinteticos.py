@@ -0,0 +1,315 @@
+"""
+Gerador de clientes sintéticos para testes de carga.
+
+Aprende as distribuições empíricas de 'shopping_trends_tratado.csv' (incluindo pares
+correlacionados como Category/Item Purchased) e gera de 1M a 100M de linhas em lotes,
+gravando em CSV ou Parquet de forma reprodutível e paralela entre os núcleos.
+
+Rodar com: python notebooks/src/clientes_sinteticos.py --linhas 1000000 --saida dados/clientes_sinteticos.csv
+"""
+
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Caminhos dos arquivos
+CAMINHO_DADOS = Path(__file__).resolve().parents[2] / "dados" / "shopping_trends_tratado.csv"
+CAMINHO_SAIDA = Path(__file__).resolve().parents[2] / "dados" / "clientes_sinteticos.csv"
+
+# Mesmas colunas (e ordem) de 'clientes_ficticios.csv', esperadas por pontuar_em_lote
+COLUNAS_SAIDA = [
+    "Item Purchased",
+    "Category",
+    "Color",
+    "Location",
+    "Size",
+    "Gender",
+    "Shipping Type",
+    "Payment Method",
+    "Discount Applied",
+    "Subscription Status",
+    "Season",
+    "Frequency of Purchases",
+    "Previous Purchases",
+    "Purchase Amount (USD)",
+    "Age"
+]
+
+# Máximo de lotes em processamento ou aguardando escrita (~55 MB por lote de 500.000 linhas)
+MAX_LOTES_PENDENTES = 8
+
+# Blocos amostrados em ordem: (colunas sorteadas em conjunto, coluna condicionante)
+BLOCOS = [
+    (["Category", "Item Purchased"], None),
+    (["Size"], "Item Purchased"),
+    (["Color"], "Item Purchased"),
+    (["Location"], "Category"),
+    (["Subscription Status", "Discount Applied"], None),
+    (["Gender"], None),
+    (["Shipping Type"], None),
+    (["Payment Method"], None),
+    (["Season"], None),
+    (["Frequency of Purchases"], None),
+    (["Previous Purchases"], "Subscription Status"),
+    (["Purchase Amount (USD)"], "Category"),
+    (["Age"], "Gender")
+]
+
+
+def _ajustar_bloco(df, colunas, condicao, blocos_ajustados):
+    """Calcula a distribuição acumulada de um bloco, condicionada (ou não) a uma coluna já amostrada."""
+    grupos = df.groupby(colunas, sort=True)
+    codigos = grupos.ngroup().to_numpy()
+    valores = grupos.size().index.to_frame(index=False)
+
+    if condicao is None:
+        origem, mapa = None, None
+        codigos_cond = np.zeros(len(df), dtype=np.int64)
+        n_cond = 1
+    else:
+        origem = next(
+            (i for i, bloco in enumerate(blocos_ajustados) if condicao in bloco["valores"].columns),
+            None
+        )
+        if origem is None:
+            raise ValueError(f"A coluna condicionante '{condicao}' precisa ser amostrada antes de {colunas}.")
+
+        indice = pd.Index(np.sort(df[condicao].unique()))
+        mapa = indice.get_indexer(blocos_ajustados[origem]["valores"][condicao])
+        codigos_cond = indice.get_indexer(df[condicao])
+        n_cond = len(indice)
+
+    contagens = np.zeros((n_cond, len(valores)))
+    np.add.at(contagens, (codigos_cond, codigos), 1)
+
+    acumulada = contagens.cumsum(axis=1) / contagens.sum(axis=1, keepdims=True)
+    acumulada[:, -1] = 1.0
+
+    # Cada linha condicional é deslocada por seu índice para permitir um único searchsorted
+    return {
+        "valores": valores,
+        "origem": origem,
+        "mapa": mapa,
+        "acumulada": (acumulada + np.arange(n_cond)[:, None]).ravel()
+    }
+
+
+def ajustar_distribuicoes(df, blocos=BLOCOS):
+    """
+    Aprende as distribuições empíricas conjuntas e condicionais de cada bloco de colunas.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame com os dados reais de compras (ex: 'shopping_trends_tratado.csv').
+    blocos : list of tuple, optional
+        Lista de pares (colunas, condicao). As colunas de um bloco são sorteadas em conjunto,
+        condicionadas ao valor já sorteado da coluna `condicao` (ou de forma marginal se None).
+
+    Returns
+    -------
+    list of dict
+        Modelo ajustado, com os valores possíveis e as distribuições acumuladas de cada bloco.
+    """
+    colunas_necessarias = list(dict.fromkeys(col for colunas, _ in blocos for col in colunas))
+    df = df[colunas_necessarias].dropna()
+
+    modelo = []
+    for colunas, condicao in blocos:
+        modelo.append(_ajustar_bloco(df, colunas, condicao, modelo))
+
+    return modelo
+
+
+def gerar_lote(modelo, n, semente=42):
+    """
+    Gera um lote de clientes sintéticos a partir do modelo ajustado.
+
+    Parameters
+    ----------
+    modelo : list of dict
+        Modelo retornado por `ajustar_distribuicoes`.
+    n : int
+        Número de linhas do lote.
+    semente : int or np.random.SeedSequence, optional
+        Semente do gerador aleatório (default=42).
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame com as colunas de `COLUNAS_SAIDA`.
+    """
+    rng = np.random.default_rng(semente)
+
+    # Sorteio dos códigos de cada bloco, na ordem das dependências
+    codigos = []
+    for bloco in modelo:
+        n_valores = len(bloco["valores"])
+        if bloco["origem"] is None:
+            codigos_cond = np.zeros(n, dtype=np.int64)
+        else:
+            codigos_cond = bloco["mapa"][codigos[bloco["origem"]]]
+
+        idx = np.searchsorted(bloco["acumulada"], codigos_cond + rng.random(n), side="right")
+        idx = np.minimum(idx, (codigos_cond + 1) * n_valores - 1)
+        codigos.append(idx - codigos_cond * n_valores)
+
+    # Conversão dos códigos para os valores originais
+    colunas = {}
+    for bloco, codigo in zip(modelo, codigos):
+        for coluna in bloco["valores"].columns:
+            colunas[coluna] = bloco["valores"][coluna].to_numpy()[codigo]
+
+    return pd.DataFrame(colunas)[COLUNAS_SAIDA]
+
+
+def _gerar_parte(modelo, n, semente, formato, cabecalho):
+    """Gera e serializa um lote no processo de trabalho, para que a escrita fique apenas no processo principal."""
+    lote = gerar_lote(modelo, n, semente)
+
+    if formato == "parquet":
+        import pyarrow as pa
+        return pa.Table.from_pandas(lote, preserve_index=False)
+
+    return lote.to_csv(index=False, header=cabecalho).encode("utf-8")
+
+
+def gerar_clientes_sinteticos(
+    caminho_saida=CAMINHO_SAIDA,
+    n_linhas=1_000_000,
+    caminho_dados=CAMINHO_DADOS,
+    semente=42,
+    tamanho_lote=500_000,
+    n_processos=None,
+    formato=None
+):
+    """
+    Gera clientes sintéticos em lotes e grava o resultado em CSV ou Parquet.
+
+    Cada lote recebe uma semente derivada de `semente`, de modo que o arquivo gerado é o
+    mesmo independentemente do número de processos utilizados.
+
+    Parameters
+    ----------
+    caminho_saida : str or Path, optional
+        Caminho do arquivo de saída (default='dados/clientes_sinteticos.csv').
+    n_linhas : int, optional
+        Número total de clientes a gerar (default=1.000.000).
+    caminho_dados : str or Path, optional
+        CSV com os dados reais usados para aprender as distribuições.
+    semente : int, optional
+        Semente aleatória para reprodução dos resultados (default=42).
+    tamanho_lote : int, optional
+        Número de linhas geradas e gravadas por lote (default=500.000).
+    n_processos : int, optional
+        Número de processos paralelos (default=todos os núcleos disponíveis, limitado
+        a `MAX_LOTES_PENDENTES` para controlar o uso de memória).
+    formato : {"csv", "parquet"}, optional
+        Formato do arquivo. Se None, é inferido pela extensão de `caminho_saida`.
+
+    Returns
+    -------
+    Path
+        Caminho do arquivo gerado.
+
+    Notas
+    -----
+    - O formato Parquet requer o pacote `pyarrow`.
+    - No máximo `MAX_LOTES_PENDENTES` lotes ficam em memória ao mesmo tempo.
+    """
+    if n_linhas <= 0:
+        raise ValueError(f"n_linhas deve ser positivo, recebido: {n_linhas}.")
+    if tamanho_lote <= 0:
+        raise ValueError(f"tamanho_lote deve ser positivo, recebido: {tamanho_lote}.")
+
+    caminho_saida = Path(caminho_saida)
+    if formato is None:
+        formato = "parquet" if caminho_saida.suffix.lower() == ".parquet" else "csv"
+    if formato not in ("csv", "parquet"):
+        raise ValueError(f"Formato inválido: {formato}. Use 'csv' ou 'parquet'.")
+    if formato == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as erro:
+            raise ImportError("O formato Parquet requer o pacote 'pyarrow'.") from erro
+
+    n_processos = min(n_processos or os.cpu_count() or 1, MAX_LOTES_PENDENTES)
+    inicio = time.perf_counter()
+
+    # Aprender distribuições a partir dos dados reais
+    modelo = ajustar_distribuicoes(pd.read_csv(caminho_dados))
+
+    # Definir tamanhos e sementes independentes de cada lote
+    tamanhos = [tamanho_lote] * (n_linhas // tamanho_lote)
+    if n_linhas % tamanho_lote:
+        tamanhos.append(n_linhas % tamanho_lote)
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+
+    caminho_saida.parent.mkdir(parents=True, exist_ok=True)
+
+    # Limitar os lotes em memória enquanto a escrita acontece em ordem
+    with ProcessPoolExecutor(max_workers=n_processos) as executor, \
+            open(caminho_saida, "wb") as arquivo:
+        escritor = None
+        pendentes = deque()
+        partes = iter(enumerate(zip(tamanhos, sementes)))
+
+        def enviar_proxima():
+            proxima = next(partes, None)
+            if proxima is not None:
+                i, (n, semente_lote) = proxima
+                pendentes.append(executor.submit(_gerar_parte, modelo, n, semente_lote, formato, i == 0))
+
+        for _ in range(MAX_LOTES_PENDENTES):
+            enviar_proxima()
+
+        while pendentes:
+            parte = pendentes.popleft().result()
+            enviar_proxima()
+
+            if formato == "parquet":
+                if escritor is None:
+                    escritor = pq.ParquetWriter(arquivo, parte.schema)
+                escritor.write_table(parte)
+            else:
+                arquivo.write(parte)
+
+        if escritor is not None:
+            escritor.close()
+
+    print(f"✅ {n_linhas:,} clientes gerados em {time.perf_counter() - inicio:.1f}s")
+    print("📁 Arquivo salvo em:", caminho_saida)
+
+    return caminho_saida
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera clientes sintéticos para testes de carga.")
+    parser.add_argument("--linhas", type=int, default=1_000_000, help="Número de clientes a gerar.")
+    parser.add_argument("--saida", type=Path, default=CAMINHO_SAIDA, help="Arquivo de saída (.csv ou .parquet).")
+    parser.add_argument("--dados", type=Path, default=CAMINHO_DADOS, help="CSV com os dados reais.")
+    parser.add_argument("--semente", type=int, default=42, help="Semente aleatória.")
+    parser.add_argument("--tamanho-lote", type=int, default=500_000, help="Linhas por lote.")
+    parser.add_argument("--processos", type=int, default=None, help="Número de processos paralelos.")
+    parser.add_argument("--formato", choices=["csv", "parquet"], default=None, help="Formato do arquivo de saída.")
+    args = parser.parse_args()
+
+    gerar_clientes_sinteticos(
+        caminho_saida=args.saida,
+        n_linhas=args.linhas,
+        caminho_dados=args.dados,
+        semente=args.semente,
+        tamanho_lote=args.tamanho_lote,
+        n_processos=args.processos,
+        formato=args.formato
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+"""
+Treinamento do modelo de classificação de Review Rating (Alta / Não-Alta).
+
+Gera o arquivo 'modelo_logistico_pipeline.pkl' mantendo a matriz de features esparsa do
+OneHotEncoder até o modelo, com regressão logística via solver 'saga' (adequado a dados
+one-hot esparsos) e retreino aquecido a partir dos coeficientes do modelo anterior.
+Para bases que não cabem em memória, o modo incremental treina um SGDClassifier em lotes.
+
+Rodar com: python notebooks/src/treino_modelo.py --dados dados/shopping_trends_tratado.csv
+Modo incremental: python notebooks/src/treino_modelo.py --incremental --tamanho-lote 500000
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.frozen import FrozenEstimator
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.metrics import classification_report, roc_auc_score
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+# Caminhos dos arquivos
+CAMINHO_DADOS = Path(__file__).resolve().parents[2] / "dados" / "shopping_trends_tratado.csv"
+CAMINHO_MODELO = Path(__file__).resolve().parents[2] / "modelos" / "modelo_logistico_pipeline.pkl"
+
+SUPERFEATURES = {
+    "Category_Item_Color": ["Category", "Item Purchased", "Color"],
+    "Category_Item_Size": ["Category", "Item Purchased", "Size"],
+    "Category_Item_Location": ["Category", "Item Purchased", "Location"]
+}
+
+COLUNAS_CATEGORICAS = [
+    "Gender",
+    "Item Purchased",
+    "Category",
+    "Location",
+    "Color",
+    "Shipping Type",
+    "Payment Method",
+    "Discount Applied",
+    "Subscription Status",
+    "Size",
+    "Season",
+    "Frequency of Purchases"
+] + list(SUPERFEATURES)
+
+COLUNAS_NUMERICAS = ["Age", "Purchase Amount (USD)", "Previous Purchases"]
+
+CLASSES = np.array(["Alta", "Não-Alta"])
+
+
+def adicionar_superfeatures(df):
+    """Cria as superfeatures Category_Item_* esperadas pelo pipeline (concatenação vetorizada)."""
+    for nome, colunas in SUPERFEATURES.items():
+        superfeature = df[colunas[0]].astype(str)
+        for coluna in colunas[1:]:
+            superfeature = superfeature + "_" + df[coluna].astype(str)
+        df[nome] = superfeature
+    return df
+
+
+def adicionar_review_binary(df):
+    """Cria a variável alvo 'Review Binary' a partir de 'Review Rating', se ainda não existir."""
+    if "Review Binary" not in df.columns:
+        df["Review Binary"] = np.where(df["Review Rating"] >= 4.1, "Alta", "Não-Alta")
+    return df
+
+
+def criar_preprocessador(categorias="auto", escalador=None):
+    """
+    Cria o pré-processador esparso do modelo.
+
+    As categóricas passam pelo OneHotEncoder (saída esparsa) e as numéricas são escaladas
+    sem centralização, o que preserva a esparsidade e acelera a convergência do 'saga'.
+    Um vocabulário fixo pode ser informado em `categorias` (uma lista por coluna categórica)
+    e um StandardScaler já ajustado em `escalador`, que não é reajustado no fit do pipeline.
+    """
+    escalador = StandardScaler(with_mean=False) if escalador is None else FrozenEstimator(escalador)
+    return ColumnTransformer([
+        ("cat", OneHotEncoder(categories=categorias, handle_unknown="ignore"), COLUNAS_CATEGORICAS),
+        ("num", escalador, COLUNAS_NUMERICAS)
+    ], sparse_threshold=1.0)
+
+
+def _coeficientes_iniciais(caminho_modelo, nomes_features):
+    """
+    Alinha os coeficientes do modelo salvo às features do novo pré-processador, pelo nome.
+
+    Features novas começam com coeficiente zero. Retorna None se o modelo salvo não puder ser
+    carregado (ex: versão incompatível do scikit-learn) ou for incompatível.
+    """
+    try:
+        pipeline_anterior = joblib.load(caminho_modelo)
+    except Exception as erro:
+        print(f"🚨 Não foi possível carregar o modelo anterior ({erro}). Treinando do zero.")
+        return None
+
+    try:
+        nomes_anteriores = pipeline_anterior.named_steps["preprocessamento"].get_feature_names_out()
+        modelo_anterior = pipeline_anterior.named_steps["modelo"]
+        coef_anterior = dict(zip(nomes_anteriores, modelo_anterior.coef_[0]))
+        intercepto = modelo_anterior.intercept_.copy()
+    except (AttributeError, KeyError, ValueError, IndexError):
+        print("🚨 Modelo anterior incompatível com o pipeline atual. Treinando do zero.")
+        return None
+
+    coef = np.array([[coef_anterior.get(nome, 0.0) for nome in nomes_features]])
+    return coef, intercepto
+
+
+def treinar_modelo(
+    df,
+    caminho_modelo=CAMINHO_MODELO,
+    aquecer=True,
+    max_iter=1000,
+    tol=1e-2,
+    salvar=True
+):
+    """
+    Treina a regressão logística do Review Binary com matriz esparsa e retreino aquecido.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame com as colunas originais dos clientes e 'Review Binary' (ou 'Review Rating').
+    caminho_modelo : str or Path, optional
+        Caminho do pipeline salvo. Se existir e `aquecer=True`, seus coeficientes são usados
+        como ponto de partida do treino (default='modelos/modelo_logistico_pipeline.pkl').
+    aquecer : bool, optional
+        Define se o treino parte dos coeficientes do modelo anterior (default=True).
+    max_iter : int, optional
+        Número máximo de épocas do solver 'saga' (default=1000).
+    tol : float, optional
+        Tolerância do critério de parada do 'saga' (default=1e-2). Em 1M de linhas, valores
+        menores multiplicam o tempo de ajuste sem alterar a AUC na terceira casa decimal.
+    salvar : bool, optional
+        Define se o pipeline treinado será salvo em `caminho_modelo` (default=True).
+
+    Returns
+    -------
+    pipeline : sklearn.pipeline.Pipeline
+        Pipeline treinado, compatível com `pontuar_cliente` e `pontuar_em_lote`.
+    metricas : dict
+        Dicionário com iterações até a convergência, tempo de ajuste, número de features,
+        densidade da matriz e se o treino foi aquecido.
+    """
+    caminho_modelo = Path(caminho_modelo)
+
+    df = adicionar_review_binary(adicionar_superfeatures(df))
+    X = df[COLUNAS_CATEGORICAS + COLUNAS_NUMERICAS]
+    y = df["Review Binary"]
+
+    # Matriz esparsa de features
+    preprocessor = criar_preprocessador()
+    X_esparso = preprocessor.fit_transform(X)
+    nomes_features = preprocessor.get_feature_names_out()
+
+    modelo = LogisticRegression(
+        solver="saga",
+        max_iter=max_iter,
+        tol=tol,
+        class_weight="balanced",
+        warm_start=True
+    )
+
+    # Coeficientes do modelo anterior como ponto de partida
+    aquecido = False
+    if aquecer and caminho_modelo.exists():
+        iniciais = _coeficientes_iniciais(caminho_modelo, nomes_features)
+        if iniciais is not None:
+            modelo.coef_, modelo.intercept_ = iniciais
+            aquecido = True
+
+    inicio = time.perf_counter()
+    modelo.fit(X_esparso, y)
+    tempo = time.perf_counter() - inicio
+
+    pipeline = Pipeline([
+        ("preprocessamento", preprocessor),
+        ("modelo", modelo)
+    ])
+
+    metricas = {
+        "Iterações": int(modelo.n_iter_[0]),
+        "Convergiu": bool(modelo.n_iter_[0] < max_iter),
+        "Tempo (s)": tempo,
+        "Linhas": X_esparso.shape[0],
+        "Features": X_esparso.shape[1],
+        "Densidade": X_esparso.nnz / (X_esparso.shape[0] * X_esparso.shape[1]),
+        "Aquecido": aquecido
+    }
+
+    print(f"🔁 Treino {'aquecido' if aquecido else 'do zero'}: {metricas['Linhas']:,} linhas, {metricas['Features']} features")
+    print(f"⏱️ Ajuste em {tempo:.2f}s com {metricas['Iterações']} iterações")
+    if not metricas["Convergiu"]:
+        print(f"🚨 O solver não convergiu em {max_iter} iterações.")
+
+    if salvar:
+        caminho_modelo.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(pipeline, caminho_modelo)
+        print("📁 Modelo salvo em:", caminho_modelo)
+
+    return pipeline, metricas
+
+
+def _colunas_leitura():
+    """Colunas originais necessárias para criar as features e o alvo."""
+    return list(dict.fromkeys(
+        [col for colunas in SUPERFEATURES.values() for col in colunas]
+        + [col for col in COLUNAS_CATEGORICAS if col not in SUPERFEATURES]
+        + COLUNAS_NUMERICAS
+        + ["Review Rating", "Review Binary"]
+    ))
+
+
+def _ler_lotes(caminho_dados, tamanho_lote):
+    """Lê o CSV em lotes, já com superfeatures e 'Review Binary'."""
+    colunas_base = _colunas_leitura()
+    leitor = pd.read_csv(caminho_dados, usecols=lambda coluna: coluna in colunas_base, chunksize=tamanho_lote)
+    for lote in leitor:
+        yield adicionar_review_binary(adicionar_superfeatures(lote))
+
+
+def construir_vocabulario(caminho_dados, tamanho_lote=500_000, lotes_validacao=1):
+    """
+    Percorre os dados em lotes para montar o vocabulário fixo e as estatísticas de treino.
+
+    O vocabulário cobre todos os lotes; a escala das numéricas e a contagem de classes usam
+    apenas os lotes de treino, ignorando os `lotes_validacao` primeiros.
+
+    Parameters
+    ----------
+    caminho_dados : str or Path
+        CSV com os dados de compras.
+    tamanho_lote : int, optional
+        Número de linhas lidas por lote (default=500.000).
+    lotes_validacao : int, optional
+        Número de lotes iniciais reservados para validação (default=1).
+
+    Returns
+    -------
+    categorias : list of np.ndarray
+        Categorias ordenadas de cada coluna em `COLUNAS_CATEGORICAS`.
+    escalador : sklearn.preprocessing.StandardScaler
+        Escalador das colunas numéricas ajustado nos lotes de treino.
+    contagem_classes : pd.Series
+        Frequência de cada classe de 'Review Binary' nos lotes de treino.
+    """
+    valores = {coluna: set() for coluna in COLUNAS_CATEGORICAS}
+    escalador = StandardScaler(with_mean=False)
+    contagem_classes = pd.Series(0, index=CLASSES)
+
+    for i, lote in enumerate(_ler_lotes(caminho_dados, tamanho_lote)):
+        for coluna in COLUNAS_CATEGORICAS:
+            valores[coluna].update(lote[coluna].dropna().unique())
+        if i < lotes_validacao:
+            continue
+        escalador.partial_fit(lote[COLUNAS_NUMERICAS])
+        contagem_classes = contagem_classes.add(lote["Review Binary"].value_counts(), fill_value=0)
+
+    categorias = [np.array(sorted(valores[coluna])) for coluna in COLUNAS_CATEGORICAS]
+    return categorias, escalador, contagem_classes
+
+
+def treinar_modelo_incremental(
+    caminho_dados=CAMINHO_DADOS,
+    caminho_modelo=CAMINHO_MODELO,
+    tamanho_lote=500_000,
+    n_epocas=1,
+    alpha=1e-4,
+    random_state=42,
+    salvar=True
+):
+    """
+    Treina o classificador de Review Binary fora da memória, com SGDClassifier e partial_fit.
+
+    Os dados são lidos em lotes do CSV. O primeiro lote é reservado para validação e os
+    demais são usados no treino. Uma primeira passada monta o vocabulário fixo das
+    categóricas (incluindo as superfeatures) em todos os lotes, e as estatísticas das
+    numéricas e os pesos das classes apenas nos lotes de treino.
+
+    Parameters
+    ----------
+    caminho_dados : str or Path, optional
+        CSV com os dados de compras (default='dados/shopping_trends_tratado.csv').
+    caminho_modelo : str or Path, optional
+        Caminho onde o pipeline será salvo (default='modelos/modelo_logistico_pipeline.pkl').
+    tamanho_lote : int, optional
+        Número de linhas por lote (default=500.000).
+    n_epocas : int, optional
+        Número de passadas sobre os lotes de treino (default=1).
+    alpha : float, optional
+        Força da regularização L2 do SGDClassifier (default=1e-4).
+    random_state : int, optional
+        Semente aleatória para reprodução dos resultados (default=42).
+    salvar : bool, optional
+        Define se o pipeline treinado será salvo em `caminho_modelo` (default=True).
+
+    Returns
+    -------
+    pipeline : sklearn.pipeline.Pipeline
+        Pipeline treinado, compatível com `pontuar_cliente` e `pontuar_em_lote`.
+    metricas : dict
+        Dicionário com AUC, F1-score da classe 'Alta' e Acurácia no lote de validação,
+        além do número de linhas de treino e do tempo total.
+
+    Notas
+    -----
+    - É necessário ao menos dois lotes: um para validação e outro para treino.
+    - As duas classes de 'Review Binary' precisam aparecer nos lotes de treino.
+    """
+    caminho_modelo = Path(caminho_modelo)
+    inicio = time.perf_counter()
+
+    # 1ª passada: vocabulário fixo, escala das numéricas e pesos das classes
+    categorias, escalador, contagem_classes = construir_vocabulario(caminho_dados, tamanho_lote)
+    if contagem_classes.sum() == 0:
+        raise ValueError("Dados insuficientes: reduza 'tamanho_lote' para ter ao menos um lote de treino.")
+    classes_ausentes = contagem_classes.index[contagem_classes == 0].tolist()
+    if classes_ausentes:
+        raise ValueError(f"Classes ausentes nos lotes de treino: {classes_ausentes}.")
+    pesos = (contagem_classes.sum() / (len(CLASSES) * contagem_classes)).to_dict()
+
+    # Pré-processador com vocabulário fixo e escala já ajustada nos lotes de treino
+    preprocessor = criar_preprocessador(categorias, escalador)
+
+    lotes = _ler_lotes(caminho_dados, tamanho_lote)
+    validacao = next(lotes)
+
+    modelo = SGDClassifier(loss="log_loss", alpha=alpha, class_weight=pesos, random_state=random_state)
+
+    # Passadas de treino, lote a lote
+    n_treino = 0
+    for epoca in range(n_epocas):
+        if epoca > 0:
+            lotes = _ler_lotes(caminho_dados, tamanho_lote)
+            next(lotes)
+        for lote in lotes:
+            X_lote = lote[COLUNAS_CATEGORICAS + COLUNAS_NUMERICAS]
+            if n_treino == 0:
+                preprocessor.fit(X_lote)
+            modelo.partial_fit(preprocessor.transform(X_lote), lote["Review Binary"], classes=CLASSES)
+            n_treino += len(lote)
+
+    pipeline = Pipeline([
+        ("preprocessamento", preprocessor),
+        ("modelo", modelo)
+    ])
+
+    # Avaliação no lote reservado
+    X_val = validacao[COLUNAS_CATEGORICAS + COLUNAS_NUMERICAS]
+    y_val = validacao["Review Binary"]
+    y_pred = pipeline.predict(X_val)
+    idx_alta = np.where(pipeline.classes_ == "Alta")[0][0]
+    y_prob = pipeline.predict_proba(X_val)[:, idx_alta]
+
+    relatorio = classification_report(y_val, y_pred, output_dict=True, zero_division=0)
+    metricas = {
+        "AUC": roc_auc_score((y_val == "Alta").astype(int), y_prob),
+        "F1_Alta": relatorio["Alta"]["f1-score"],
+        "Accuracy": relatorio["accuracy"],
+        "Linhas treino": n_treino // n_epocas,
+        "Tempo (s)": time.perf_counter() - inicio
+    }
+
+    print(f"🔁 Treino incremental: {metricas['Linhas treino']:,} linhas, {n_epocas} época(s), {metricas['Tempo (s)']:.1f}s")
+    print(f"🎯 Validação – AUC: {metricas['AUC']:.3f} | F1 Alta: {metricas['F1_Alta']:.3f} | Acurácia: {metricas['Accuracy']:.3f}")
+
+    if salvar:
+        caminho_modelo.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(pipeline, caminho_modelo)
+        print("📁 Modelo salvo em:", caminho_modelo)
+
+    return pipeline, metricas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Treina o modelo de classificação de Review Rating.")
+    parser.add_argument("--dados", type=Path, default=CAMINHO_DADOS, help="CSV com os dados de treino.")
+    parser.add_argument("--modelo", type=Path, default=CAMINHO_MODELO, help="Caminho do pipeline (.pkl).")
+    parser.add_argument("--sem-aquecimento", action="store_true", help="Treina do zero, ignorando o modelo anterior.")
+    parser.add_argument("--max-iter", type=int, default=1000, help="Número máximo de épocas do solver.")
+    parser.add_argument("--tol", type=float, default=1e-2, help="Tolerância do critério de parada.")
+    parser.add_argument("--incremental", action="store_true", help="Treina fora da memória com SGDClassifier em lotes.")
+    parser.add_argument("--tamanho-lote", type=int, default=500_000, help="Linhas por lote no modo incremental.")
+    parser.add_argument("--epocas", type=int, default=1, help="Passadas sobre os dados no modo incremental.")
+    args = parser.parse_args()
+
+    if args.incremental:
+        treinar_modelo_incremental(
+            caminho_dados=args.dados,
+            caminho_modelo=args.modelo,
+            tamanho_lote=args.tamanho_lote,
+            n_epocas=args.epocas
+        )
+        return
+
+    colunas_base = _colunas_leitura()
+    df = pd.read_csv(args.dados, usecols=lambda coluna: coluna in colunas_base)
+
+    treinar_modelo(
+        df,
+        caminho_modelo=args.modelo,
+        aquecer=not args.sem_aquecimento,
+        max_iter=args.max_iter,
+        tol=args.tol
+    )
+
+
+if __name__ == "__main__":
+    main()